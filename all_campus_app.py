@@ -1,21 +1,23 @@
 import streamlit as st
-import pandas as pd
 import os
-import zipfile
-from io import BytesIO
 
+# pandas, openpyxl and the helper modules that depend on them are imported
+# only once a file is opened, so the page shell paints before they load.
 
 st.set_page_config(page_title="Merit List Generator", layout="wide")
 st.title("🎓 Merit List Generator with Seat Matrix Integration")
 
+# Candidates called for counselling per seat
+CALL_MULTIPLIER = 3
+
 EXPORT_COLUMNS = [
     "Merit No.", "FORM NUMBER", "NAME OF THE APPLICANT", "CATEGORY", "EMAIL", "MOBILE",
     "ObtainMarks", "Counselling Status"
 ]
 
-@st.cache_data
+@st.cache_resource
 def load_seat_matrix():
-    return pd.DataFrame([
+    rows = [
         {
             "School": "School of Cyber Security and Digital Forensics",
             "Program": "M.Tech. Cyber Security",
@@ -52,7 +54,21 @@ def load_seat_matrix():
             "EWS": 3,
             "PwD": 1
         }
-    ])
+    ]
+    return {f"{row['Program']} ({row['Campus']})": row for row in rows}
+
+@st.cache_data(max_entries=32)
+def list_entries(folder, mtime, dirs=False):
+    # mtime is part of the cache key so new files show up without a restart
+    if dirs:
+        return [d for d in os.listdir(folder) if os.path.isdir(os.path.join(folder, d))]
+    return [f for f in os.listdir(folder) if f.endswith(('.xlsx', '.xls'))]
+
+@st.cache_data(max_entries=8)
+def load_merged_file(path, mtime):
+    # read_excel picks the engine (openpyxl/xlrd) itself and imports it lazily
+    import pandas as pd
+    return pd.read_excel(path)
 
 def extract_program_name(file_name):
     return os.path.splitext(os.path.basename(file_name))[0].replace("_", " ").replace("MERGED", "").strip().upper()
@@ -64,7 +80,7 @@ def assign_merit_numbers(df):
     return df
 
 def generate_general_merit_list(df, seats):
-    total_call = seats.get("GENERAL", 0) * 3
+    total_call = seats.get("GENERAL", 0) * CALL_MULTIPLIER
     df_sorted = assign_merit_numbers(df)
     df_sorted["Counselling Status"] = ["Called for Counselling" if i < total_call else "Waitlisted" for i in range(len(df_sorted))]
     return df_sorted
@@ -76,7 +92,7 @@ def generate_category_merit_lists(df, seats):
             continue
         sub_df = df[df["CATEGORY"] == cat].copy()
         sub_df = assign_merit_numbers(sub_df)
-        top_n = seats.get(cat.strip().upper(), 0) * 3
+        top_n = seats.get(cat.strip().upper(), 0) * CALL_MULTIPLIER
         sub_df["Counselling Status"] = ["Called for Counselling" if i < top_n else "Waitlisted" for i in range(len(sub_df))]
         category_dfs[cat] = sub_df
     return category_dfs
@@ -123,26 +139,35 @@ def normalize_category(cat):
 
 # Load merged files
 MERGED_FOLDER = "merged_files"
-merged_files = [f for f in os.listdir(MERGED_FOLDER) if f.endswith(('.xlsx', '.xls'))]
-selected_file = st.sidebar.selectbox("📁 Select Merged File", merged_files)
+merged_files = list_entries(MERGED_FOLDER, os.path.getmtime(MERGED_FOLDER))
+# No default file, so nothing heavy loads until the user picks one
+selected_file = st.sidebar.selectbox("📁 Select Merged File", merged_files, index=None, placeholder="Choose a file…")
 
-seat_matrix_df = load_seat_matrix()
+seat_matrix = load_seat_matrix()
 
 if selected_file:
     file_path = os.path.join(MERGED_FOLDER, selected_file)
-    df_raw = pd.read_excel(file_path)
+    import pandas as pd
+    from data_validation import validate_applicants
+    from results_store import save_run
+    from results_viewer import prepare_results, show_paginated_results, show_validation_report
+
+    file_mtime = os.path.getmtime(file_path)
+    df_raw = load_merged_file(file_path, file_mtime)
     
     st.write(f"📄 Total rows before filtering: {len(df_raw)}")
     program_name = extract_program_name(selected_file)
 
     st.header(f"📘 Program: {program_name}")
     st.info(f"🔍 Extracted Program Name from File: `{program_name}`")
-    # Filter Present only
-    df = df_raw[df_raw["Final_Attendance"].astype(str).str.strip().str.lower() == "present"].copy()
+    # Keep Present rows with valid marks/PwD %; report these and bad contact details
+    df, validation_report = validate_applicants(df_raw)
+    df = df.copy()
     df["CATEGORY"] = df["CATEGORY"].astype(str).str.strip()
     df["CATEGORY"] = df["CATEGORY"].apply(normalize_category)  # normalize here
     df["ObtainMarks"] = pd.to_numeric(df["ObtainMarks"], errors="coerce")
-    df_cleaned = df.dropna(subset=["ObtainMarks"])
+    df_cleaned = df
+    show_validation_report(validation_report, program_name)
 
     # Display category count
     category_counts = df_cleaned["CATEGORY"].value_counts().sort_index()
@@ -157,15 +182,13 @@ if selected_file:
 
 
     # Build dropdown options
-    program_options = seat_matrix_df.apply(lambda row: f"{row['Program']} ({row['Campus']})", axis=1).tolist()
+    program_options = list(seat_matrix)
 
     # Show dropdown for user to select the correct program
     selected_program_label = st.selectbox("🎯 Select Matching Program for seat matrix", program_options)
 
     # Extract the selected row
-    program_row = seat_matrix_df[seat_matrix_df.apply(
-        lambda row: f"{row['Program']} ({row['Campus']})" == selected_program_label, axis=1
-    )].iloc[0]
+    program_row = seat_matrix.get(selected_program_label)
 
     seat_inputs = {}
 
@@ -189,53 +212,104 @@ if selected_file:
         st.markdown(f"- 🏷️ **Categories Detected (in Present entries):** `{', '.join(sorted(df_cleaned['CATEGORY'].unique()))}`")
         # st.dataframe(df_cleaned[EXPORT_COLUMNS[:-1]].head(10), use_container_width=True)
 
-if st.button("🔍 Generate Merit Lists"):
+else:
+    st.info("📂 Select a merged file from the sidebar to get started.")
+
+if selected_file and st.button("🔍 Generate Merit Lists"):
     # 🟢 Generate merit lists first
     general_df = generate_general_merit_list(df_cleaned, seat_inputs)
     category_lists = generate_category_merit_lists(df_cleaned, seat_inputs)
     pwd_df = generate_pwd_merit_list(df_cleaned)
 
+    # 🟢 Build each CSV once; reruns reuse the stored bytes
+    general_csv = general_df[EXPORT_COLUMNS].to_csv(index=False)
+    category_csvs = {
+        cat: cat_df[EXPORT_COLUMNS].to_csv(index=False)
+        for cat, cat_df in category_lists.items()
+        if cat.strip().upper() != "GENERAL"
+    }
+    pwd_csv = pwd_df[EXPORT_COLUMNS].to_csv(index=False) if not pwd_df.empty else None
+    for cat in category_csvs:
+        display_tie_summary(category_lists[cat], cat)
+    if pwd_csv is not None:
+        display_tie_summary(pwd_df, "PwD")
+
     # 🟢 Prepare ZIP
+    import zipfile
+    from io import BytesIO
+
     zip_buffer = BytesIO()
     with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
         # Add general merit list
-        zip_file.writestr(f"{program_name}_general_merit_list.csv", general_df[EXPORT_COLUMNS].to_csv(index=False))
+        zip_file.writestr(f"{program_name}_general_merit_list.csv", general_csv)
 
         # Add category-wise lists
-        for cat, cat_df in category_lists.items():
-            if cat.strip().upper() == "GENERAL":
-                continue
-            zip_file.writestr(f"{program_name}_{cat}_merit_list.csv", cat_df[EXPORT_COLUMNS].to_csv(index=False))
+        for cat, csv_cat in category_csvs.items():
+            zip_file.writestr(f"{program_name}_{cat}_merit_list.csv", csv_cat)
 
         # Add PwD list
-        if not pwd_df.empty:
-            zip_file.writestr(f"{program_name}_pwd_merit_list.csv", pwd_df[EXPORT_COLUMNS].to_csv(index=False))
+        if pwd_csv is not None:
+            zip_file.writestr(f"{program_name}_pwd_merit_list.csv", pwd_csv)
+
+    # Persist the run so applicants can be looked up later (see lookup_app.py).
+    # A store failure must not block the downloads below.
+    try:
+        run_id = save_run(
+            general_df, category_lists, pwd_df, program_name, seat_inputs, multiplier=CALL_MULTIPLIER,
+            campus=program_row["Campus"] if program_row else None, source_file=selected_file,
+        )
+    except Exception as e:
+        run_id = None
+        st.warning(f"⚠️ Merit lists were generated but could not be saved to the results store. Error: {e}")
+
+    # Keep results across reruns so paging/searching doesn't need a regenerate
+    st.session_state["merit_results"] = {
+        "run_id": run_id,
+        "program_name": program_name,
+        "file_path": file_path,
+        "file_mtime": file_mtime,
+        "seat_inputs": dict(seat_inputs),
+        "general": {"view": prepare_results(general_df, EXPORT_COLUMNS), "csv": general_csv.encode("utf-8")},
+        "categories": {
+            cat: {"view": prepare_results(category_lists[cat], EXPORT_COLUMNS), "csv": csv_cat.encode("utf-8")}
+            for cat, csv_cat in category_csvs.items()
+        },
+        "pwd": (
+            {"view": prepare_results(pwd_df, EXPORT_COLUMNS), "csv": pwd_csv.encode("utf-8")}
+            if pwd_csv is not None else None
+        ),
+        "zip": zip_buffer.getvalue(),
+    }
 
-    zip_buffer.seek(0)
-    st.download_button("📦 Download All Merit Lists as ZIP", data=zip_buffer, file_name=f"{program_name}_all_merit_lists.zip", mime="application/zip")
+merit_results = st.session_state.get("merit_results")
+# Only show lists generated from the current file and inputs; editing a seat
+# count or re-merging the file hides them until the user generates again
+if selected_file and merit_results and (
+    merit_results["file_path"] == file_path
+    and merit_results["file_mtime"] == file_mtime
+    and merit_results["seat_inputs"] == seat_inputs
+):
+    if merit_results["run_id"] is not None:
+        st.caption(f"💾 Saved as run #{merit_results['run_id']}")
+    st.download_button("📦 Download All Merit Lists as ZIP", data=merit_results["zip"], file_name=f"{program_name}_all_merit_lists.zip", mime="application/zip")
 
     # General Merit List
     st.subheader("🌐 General Merit List")
-    st.dataframe(general_df[EXPORT_COLUMNS], use_container_width=True)
-    st.download_button("⬇️ Download General Merit List", data=general_df[EXPORT_COLUMNS].to_csv(index=False).encode("utf-8"), file_name=f"{program_name}_general_merit_list.csv")
+    show_paginated_results(merit_results["general"]["view"], key="general")
+    st.download_button("⬇️ Download General Merit List", data=merit_results["general"]["csv"], file_name=f"{program_name}_general_merit_list.csv")
 
     # Category-wise Merit List
     st.subheader("🏅 Category-wise Merit Lists")
-    for cat, cat_df in category_lists.items():
-        if cat.strip().upper() == "GENERAL":
-            continue
+    for cat, cat_result in merit_results["categories"].items():
         st.markdown(f"### 📘 Category: `{cat}`")
-        st.dataframe(cat_df[EXPORT_COLUMNS], use_container_width=True)
-        display_tie_summary(cat_df, cat)
-        csv_cat = cat_df[EXPORT_COLUMNS].to_csv(index=False).encode("utf-8")
-        st.download_button(f"⬇️ Download `{cat}` Merit List CSV", data=csv_cat, file_name=f"{program_name}_{cat}_merit_list.csv", mime="text/csv", key=f"download_{cat}")
+        show_paginated_results(cat_result["view"], key=f"cat_{cat}")
+        st.download_button(f"⬇️ Download `{cat}` Merit List CSV", data=cat_result["csv"], file_name=f"{program_name}_{cat}_merit_list.csv", mime="text/csv", key=f"download_{cat}")
 
     # PwD List
     st.subheader("♿ PwD Merit List")
-    if not pwd_df.empty:
-        st.dataframe(pwd_df[EXPORT_COLUMNS], use_container_width=True)
-        display_tie_summary(pwd_df, "PwD")
-        csv_pwd = pwd_df[EXPORT_COLUMNS].to_csv(index=False).encode("utf-8")
-        st.download_button("⬇️ Download PwD Merit List", data=csv_pwd, file_name=f"{program_name}_pwd_merit_list.csv", mime="text/csv")
+    pwd_result = merit_results["pwd"]
+    if pwd_result is not None:
+        show_paginated_results(pwd_result["view"], key="pwd")
+        st.download_button("⬇️ Download PwD Merit List", data=pwd_result["csv"], file_name=f"{program_name}_pwd_merit_list.csv", mime="text/csv")
     else:
         st.info("No PwD candidates found.")
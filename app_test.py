@@ -1,6 +1,12 @@
 import streamlit as st
 import pandas as pd
 import os
+import hashlib
+from io import BytesIO
+
+from data_validation import validate_applicants
+from merit_list import generate_merit_list
+from results_viewer import prepare_results, show_paginated_results, show_validation_report
 
 st.set_page_config(page_title="Merit List Generator", layout="wide")
 st.title("🎓 Merit List Generator")
@@ -18,40 +24,29 @@ CATEGORY_COLORS = {
 def extract_program_name(file_name):
     return os.path.splitext(os.path.basename(file_name))[0].replace("_", " ").upper()
 
-def highlight_category_and_ties(df):
-    tie_mask = df["ObtainMarks"].duplicated(keep=False)
-
-    def style_row(row):
-        base_color = CATEGORY_COLORS.get(str(row["CATEGORY"]).strip().upper(), "#FFFFFF")
-        style = []
-        is_tie = tie_mask.loc[row.name]
-        for col in df.columns:
-            cell_style = f"background-color: {base_color};"
-            if is_tie:
-                cell_style += "border: 2px solid red;"
-            style.append(cell_style)
-        return style
-
-    return df.style.apply(style_row, axis=1)
+@st.cache_data(max_entries=8)
+def load_excel_bytes(file_hash, _file_bytes):
+    # Keyed on the content hash only, so re-uploads of the same workbook are free
+    return pd.read_excel(BytesIO(_file_bytes))
 
-def generate_merit_list(df, seat_matrix):
-    merit_final = pd.DataFrame()
+@st.cache_data(max_entries=8)
+def load_excel_path(path, mtime):
+    return pd.read_excel(path)
 
-    for category in df["CATEGORY"].dropna().unique():
-        cat_df = df[df["CATEGORY"] == category]
-        seats = int(seat_matrix.get(category, 0)) * 2
-        top = cat_df.sort_values(by="ObtainMarks", ascending=False).head(seats).copy()
-        top.insert(0, "Sl. No.", range(1, len(top) + 1))
-        merit_final = pd.concat([merit_final, top])
-
-    selected_cols = ["Sl. No.", "FORM NUMBER", "Applicant Registration No", "NAME OF THE APPLICANT", "CATEGORY", "ObtainMarks"]
-    return merit_final[selected_cols]
+def read_selected_file(selected_file):
+    """Return the parsed frame and a key that changes whenever the file content does."""
+    if hasattr(selected_file, "getvalue"):
+        file_bytes = selected_file.getvalue()
+        file_hash = hashlib.sha256(file_bytes).hexdigest()
+        return load_excel_bytes(file_hash, file_bytes), file_hash
+    mtime = os.path.getmtime(selected_file)
+    return load_excel_path(selected_file, mtime), (selected_file, mtime)
 
 # --- Demo File ---
 DEFAULT_DEMO_PATH = "excel_files/demo_merit_sample.xlsx"
 demo_df = None
 if os.path.exists(DEFAULT_DEMO_PATH):
-    demo_df = pd.read_excel(DEFAULT_DEMO_PATH)
+    demo_df = load_excel_path(DEFAULT_DEMO_PATH, os.path.getmtime(DEFAULT_DEMO_PATH))
 
 # --- Sidebar File Uploader ---
 st.sidebar.header("📁 Upload or Use Demo File")
@@ -63,16 +58,17 @@ selected_file = uploaded_file if uploaded_file else (DEFAULT_DEMO_PATH if use_de
 
 if selected_file:
     try:
-        df_raw = pd.read_excel(selected_file)
+        df_raw, file_key = read_selected_file(selected_file)
         program_name = extract_program_name(selected_file.name if hasattr(selected_file, "name") else selected_file)
         st.header(f"📘 Program: {program_name}")
 
         # Clean data
-        df = df_raw.copy()
+        original_rows = df_raw.shape[0]
+        df, validation_report = validate_applicants(df_raw)
+        df = df.copy()
         df["CATEGORY"] = df["CATEGORY"].astype(str).str.strip()
-        original_rows = df.shape[0]
         df["ObtainMarks"] = pd.to_numeric(df["ObtainMarks"], errors="coerce")
-        df_cleaned = df.dropna(subset=["ObtainMarks"])
+        df_cleaned = df
         cleaned_rows = df_cleaned.shape[0]
         removed_rows = original_rows - cleaned_rows
         unique_categories = sorted(df_cleaned["CATEGORY"].dropna().unique())
@@ -82,13 +78,14 @@ if selected_file:
         with st.expander("📊 File Summary and Statistics", expanded=True):
             st.markdown(f"""
             - 🧾 **Original Rows:** {original_rows}  
-            - ❌ **Rows Removed (Missing/Absent):** {removed_rows}  
+            - ❌ **Rows Removed (Failed Validation):** {removed_rows}  
             - ✅ **Valid Rows Remaining:** {cleaned_rows}  
             - 🧮 **Unique Categories:** {category_count}  
             - 🏷️ **Categories Detected:** `{", ".join(unique_categories)}`
             """)
             cat_counts = df_cleaned["CATEGORY"].value_counts().rename_axis('CATEGORY').reset_index(name='Count')
             st.dataframe(cat_counts)
+        show_validation_report(validation_report, program_name)
 
         # 🪑 Seat matrix input
         st.subheader("🪑 Enter Available Seats per Category")
@@ -104,14 +101,22 @@ if selected_file:
 
         # Generate Merit List
         if st.button("🔍 Generate Merit List"):
-            st.subheader("🏆 Merit List (2× Seats Per Category)")
             merit_df = generate_merit_list(df_cleaned, seat_matrix)
-            styled_df = highlight_category_and_ties(merit_df)
-            st.dataframe(styled_df, use_container_width=True)
+            # View and CSV are built once here; paging reruns reuse them
+            st.session_state["merit_result"] = {
+                "view": prepare_results(merit_df),
+                "csv": merit_df.to_csv(index=False).encode("utf-8"),
+            }
+            st.session_state["merit_inputs"] = (file_key, dict(seat_matrix))
+
+        # Hide a list generated from other file content or different seat counts
+        merit_result = st.session_state.get("merit_result")
+        if merit_result is not None and st.session_state.get("merit_inputs") == (file_key, seat_matrix):
+            st.subheader("🏆 Merit List (2× Seats Per Category)")
+            show_paginated_results(merit_result["view"], key="merit", category_colors=CATEGORY_COLORS)
 
             # CSV Download
-            csv = merit_df.to_csv(index=False).encode("utf-8")
-            st.download_button("⬇️ Download CSV", data=csv, file_name=f"{program_name}_merit_list.csv", mime="text/csv")
+            st.download_button("⬇️ Download CSV", data=merit_result["csv"], file_name=f"{program_name}_merit_list.csv", mime="text/csv")
 
     except Exception as e:
         st.error(f"❌ Failed to process the file. Error: {e}")
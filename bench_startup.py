@@ -0,0 +1,74 @@
+# bench_startup.py
+#
+# Measures cold-start and rerun time of the Streamlit apps. Every sample runs
+# in a fresh interpreter so module imports are paid again, the same as when
+# an app container is restarted.
+#
+#   python bench_startup.py                 # all_campus_app.py and app.py, 5 runs each
+#   python bench_startup.py app.py --runs 10
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+DEFAULT_APPS = ["all_campus_app.py", "app.py"]
+
+# Runs inside the child interpreter
+SAMPLE_SCRIPT = r"""
+import json, sys, time
+start = time.perf_counter()
+import streamlit
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+at.run()
+first_run = time.perf_counter()
+at.run()
+rerun = time.perf_counter()
+print(json.dumps({
+    "import_streamlit": imported - start,
+    "first_run": first_run - imported,
+    "rerun": rerun - first_run,
+    "errors": [str(e.value) for e in at.exception],
+}))
+"""
+
+# Cost of the modules the apps used to import before the first paint
+HEAVY_IMPORTS = "import time; t = time.perf_counter(); import pandas, openpyxl, zipfile; print(time.perf_counter() - t)"
+
+
+def run_sample(app):
+    out = subprocess.run(
+        [sys.executable, "-c", SAMPLE_SCRIPT, app], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Streamlit app startup time")
+    parser.add_argument("apps", nargs="*", default=DEFAULT_APPS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    heavy = [
+        float(subprocess.run([sys.executable, "-c", HEAVY_IMPORTS], capture_output=True, text=True, check=True).stdout)
+        for _ in range(args.runs)
+    ]
+    print(f"pandas + openpyxl + zipfile import: {statistics.median(heavy) * 1000:.0f} ms (median of {args.runs})\n")
+
+    for app in args.apps:
+        samples = [run_sample(app) for _ in range(args.runs)]
+        print(f"📊 {app}")
+        for key in ("import_streamlit", "first_run", "rerun"):
+            values = [s[key] * 1000 for s in samples]
+            print(f"   {key:<17} median {statistics.median(values):7.0f} ms   min {min(values):7.0f} ms   max {max(values):7.0f} ms")
+        errors = {e for s in samples for e in s["errors"]}
+        for error in errors:
+            print(f"   ❌ {error}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
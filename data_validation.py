@@ -0,0 +1,110 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Checked after spaces/dashes are stripped; allows international numbers
+MOBILE_PATTERN = re.compile(r"\+?\d{10,15}")
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+
+PWD_COLUMN = "PwD (PERCENTAGE OF DISABILITY)"
+
+REPORT_COLUMNS = ["Source Row", "FORM NUMBER", "NAME OF THE APPLICANT", "Excluded from Ranking", "Reasons"]
+
+
+def _as_text(series):
+    return series.astype("string").str.strip()
+
+
+def _is_blank(text):
+    return text.isna() | text.eq("")
+
+
+def invalid_marks(df):
+    return pd.to_numeric(df["ObtainMarks"], errors="coerce").isna()
+
+
+def not_present(df):
+    return _as_text(df["Final_Attendance"]).str.lower().ne("present").fillna(True).astype(bool)
+
+
+def malformed_mobile(df):
+    # Excel often stores numbers as floats (9876543210.0); people type "94308 91802"
+    text = _as_text(df["MOBILE"]).str.replace(r"\.0$", "", regex=True).str.replace(r"[\s-]", "", regex=True)
+    bad = ~text.str.fullmatch(MOBILE_PATTERN)
+    return (~_is_blank(text) & bad).fillna(False).astype(bool)
+
+
+def malformed_email(df):
+    text = _as_text(df["EMAIL"])
+    bad = ~text.str.fullmatch(EMAIL_PATTERN)
+    return (~_is_blank(text) & bad).fillna(False).astype(bool)
+
+
+def pwd_out_of_range(df):
+    text = _as_text(df[PWD_COLUMN])
+    values = pd.to_numeric(text, errors="coerce")
+    # Non-numeric text coerces to NA, which must count as out of range
+    in_range = values.between(0, 100).fillna(False).astype(bool)
+    return (~_is_blank(text) & ~in_range).fillna(False).astype(bool)
+
+
+# (column, reason, rule, excludes) - a rule is skipped when its column is not in
+# the file. Rules with excludes=False are reported but never drop a candidate.
+# Blank MOBILE/EMAIL/PwD values are allowed; only malformed ones are flagged.
+VALIDATION_RULES = [
+    ("ObtainMarks", "Invalid or missing marks", invalid_marks, True),
+    ("Final_Attendance", "Not marked present", not_present, True),
+    (PWD_COLUMN, "PwD % outside 0-100", pwd_out_of_range, False),
+    ("MOBILE", "Malformed mobile number", malformed_mobile, False),
+    ("EMAIL", "Malformed email", malformed_email, False),
+]
+
+
+def validate_applicants(df):
+    """Run every validation rule as a column operation.
+
+    Returns the rows that can be ranked, plus a report with one line per
+    flagged row listing every reason it failed and whether it was excluded.
+    A PwD % that fails validation is blanked in the returned rows, so the
+    applicant stays in the general/category lists but not the PwD list.
+    """
+    reasons = pd.Series("", index=df.index, dtype=object)
+    flagged = np.zeros(len(df), dtype=bool)
+    excluded = np.zeros(len(df), dtype=bool)
+    masks = {}
+
+    for column, reason, rule, excludes in VALIDATION_RULES:
+        if column not in df.columns:
+            continue
+        mask = rule(df).to_numpy()
+        masks[column] = mask
+        flagged |= mask
+        if excludes:
+            excluded |= mask
+        reasons = reasons + np.where(mask, reason + "; ", "")
+
+    report = pd.DataFrame({
+        # Row number as seen in Excel: 1-based plus the header row
+        "Source Row": np.arange(len(df)) + 2,
+        "FORM NUMBER": df["FORM NUMBER"] if "FORM NUMBER" in df.columns else None,
+        "NAME OF THE APPLICANT": df["NAME OF THE APPLICANT"] if "NAME OF THE APPLICANT" in df.columns else None,
+        "Excluded from Ranking": excluded,
+        "Reasons": reasons.str.rstrip("; "),
+    }, index=df.index)[flagged]
+
+    ranked = df[~excluded]
+    bad_pwd = masks.get(PWD_COLUMN, np.zeros(len(df), dtype=bool))[~excluded]
+    if bad_pwd.any():
+        ranked = ranked.copy()
+        ranked.loc[bad_pwd, PWD_COLUMN] = None
+
+    return ranked, report[REPORT_COLUMNS]
+
+
+def summarize_report(report):
+    """Count flagged rows per reason."""
+    return (
+        report["Reasons"].str.split("; ").explode()
+        .value_counts().rename_axis("Reason").reset_index(name="Rows")
+    )
@@ -0,0 +1,47 @@
+import streamlit as st
+
+from results_store import diff_runs, list_runs, lookup_applicant, run_list_names
+from results_viewer import prepare_results, show_paginated_results
+
+st.set_page_config(page_title="Merit Results Lookup", layout="wide")
+st.title("🔎 Merit Results Lookup")
+
+lookup_tab, diff_tab = st.tabs(["👤 Applicant Lookup", "🔀 Compare Runs"])
+
+with lookup_tab:
+    query = st.text_input("Enter FORM NUMBER, EMAIL or MOBILE")
+    if query:
+        matches = lookup_applicant(query)
+        if matches.empty:
+            st.warning("No stored results found for this applicant.")
+        else:
+            st.success(f"Found {len(matches)} result(s) across {matches['run_id'].nunique()} run(s)")
+            st.dataframe(matches, use_container_width=True)
+
+with diff_tab:
+    runs = list_runs()
+    if runs.empty:
+        st.info("No runs stored yet. Generate merit lists in the main app first.")
+    else:
+        program_name = st.selectbox("📘 Program", sorted(runs["program_name"].unique()))
+        program_runs = runs[runs["program_name"] == program_name]
+        run_labels = {
+            row.run_id: f"#{row.run_id} — {row.created_at} ({row.campus or 'n/a'}, ×{row.multiplier})"
+            for row in program_runs.itertuples()
+        }
+
+        if len(run_labels) < 2:
+            st.info("Only one run stored for this program; generate it again to compare.")
+        else:
+            run_ids = list(run_labels)
+            col_old, col_new = st.columns(2)
+            old_run = col_old.selectbox("Old run", run_ids, index=1, format_func=run_labels.get)
+            new_run = col_new.selectbox("New run", run_ids, index=0, format_func=run_labels.get)
+
+            list_name = st.selectbox("List", sorted(run_list_names(old_run) | run_list_names(new_run)))
+
+            changes = diff_runs(old_run, new_run, list_name)
+            st.markdown(f"**{len(changes)}** applicant(s) changed status in `{list_name}`")
+            show_paginated_results(prepare_results(changes.rename(columns={
+                "form_number": "FORM NUMBER", "name": "NAME OF THE APPLICANT"
+            })), key="run_diff")
@@ -4,12 +4,16 @@ import os
 import pandas as pd
 import difflib
 
+from data_validation import validate_applicants, summarize_report
+
 # Directories
 excel_folder = "excel_files"
 merge_folder = "merge_by_mistake_international"
 merged_folder = "merged_files"
+report_folder = os.path.join(merged_folder, "validation_reports")
 
 os.makedirs(merged_folder, exist_ok=True)
+os.makedirs(report_folder, exist_ok=True)
 
 # Required columns
 required_columns = [
@@ -54,6 +58,8 @@ def merge_files_by_keyword():
                 # Filter only required columns
                 available_cols = [col for col in required_columns if col in combined.columns]
                 missing_cols = [col for col in required_columns if col not in available_cols]
+                # Validate before the None-fill so rules for missing columns are skipped
+                validation_source = combined[available_cols]
                 for col in missing_cols:
                     combined[col] = None
 
@@ -66,6 +72,19 @@ def merge_files_by_keyword():
                 merged_count += 1
             except Exception as e:
                 print(f"❌ Failed to merge {ef} with {match}: {e}")
+                continue
+
+            # Report flagged rows and which of them ranking will exclude
+            try:
+                _, report = validate_applicants(validation_source)
+                report_name = f"{os.path.splitext(merged_name)[0]}_validation.csv"
+                report.to_csv(os.path.join(report_folder, report_name), index=False)
+                excluded = int(report["Excluded from Ranking"].sum())
+                print(f"   🚫 Flagged rows: {len(report)} ({excluded} excluded from ranking) ➜ {report_name}")
+                for _, row in summarize_report(report).iterrows():
+                    print(f"      - {row['Reason']}: {row['Rows']}")
+            except Exception as e:
+                print(f"⚠️ Merged {merged_name}, but the validation report failed: {e}")
 
     if merged_count == 0:
         print("⚠️ No files were merged.")
@@ -0,0 +1,23 @@
+MERIT_COLUMNS = ["Sl. No.", "FORM NUMBER", "Applicant Registration No", "NAME OF THE APPLICANT", "CATEGORY", "ObtainMarks"]
+
+
+def generate_merit_list(df, seat_matrix):
+    """Top (seats × 2) applicants per category, categories in order of first appearance.
+
+    One stable sort and a grouped cumcount replace the per-category
+    sort-and-concat loop; output is identical.
+    """
+    df = df.dropna(subset=["CATEGORY"])
+    category_order = {cat: i for i, cat in enumerate(df["CATEGORY"].unique())}
+    seat_limits = {cat: int(seat_matrix.get(cat, 0)) * 2 for cat in category_order}
+
+    ranked = (
+        df.assign(_cat_order=df["CATEGORY"].map(category_order))
+        .sort_values(by=["_cat_order", "ObtainMarks"], ascending=[True, False], kind="stable")
+    )
+    position = ranked.groupby("CATEGORY", sort=False).cumcount()
+    within_seats = position < ranked["CATEGORY"].map(seat_limits)
+    merit_final = ranked[within_seats].copy()
+    merit_final.insert(0, "Sl. No.", position[within_seats] + 1)
+
+    return merit_final[MERIT_COLUMNS]
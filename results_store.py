@@ -0,0 +1,184 @@
+import json
+import sqlite3
+from contextlib import closing, contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+DB_PATH = "merit_results.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    campus TEXT,
+    program_name TEXT NOT NULL,
+    source_file TEXT,
+    multiplier INTEGER,
+    seat_inputs TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    list_name TEXT NOT NULL,
+    merit_no INTEGER,
+    form_number TEXT,
+    name TEXT,
+    category TEXT,
+    email TEXT,
+    mobile TEXT,
+    marks REAL,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_form_number ON results(form_number);
+CREATE INDEX IF NOT EXISTS idx_results_email ON results(email);
+CREATE INDEX IF NOT EXISTS idx_results_mobile ON results(mobile);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id, list_name);
+CREATE INDEX IF NOT EXISTS idx_runs_program ON runs(program_name);
+"""
+
+# Merit list column -> results table column
+RESULT_COLUMNS = {
+    "Merit No.": "merit_no",
+    "FORM NUMBER": "form_number",
+    "NAME OF THE APPLICANT": "name",
+    "CATEGORY": "category",
+    "EMAIL": "email",
+    "MOBILE": "mobile",
+    "ObtainMarks": "marks",
+    "Counselling Status": "status",
+}
+
+
+# Databases whose schema has been created by this process
+_schema_ready = set()
+
+
+@contextmanager
+def connect(db_path=DB_PATH):
+    """Yield a connection inside one transaction and always close it afterwards."""
+    with closing(sqlite3.connect(db_path)) as conn:
+        if db_path not in _schema_ready:
+            conn.executescript(SCHEMA)
+            _schema_ready.add(db_path)
+        with conn:
+            yield conn
+
+
+def normalize_form_number(values):
+    return values.astype("string").str.strip().str.replace(r"\.0$", "", regex=True)
+
+
+def normalize_email(values):
+    return values.astype("string").str.strip().str.lower()
+
+
+def normalize_mobile(values):
+    # Keep the last 10 digits so +91/0 prefixes still match
+    return values.astype("string").str.replace(r"\.0$", "", regex=True).str.replace(r"\D", "", regex=True).str[-10:]
+
+
+def _to_rows(df, run_id, list_name):
+    rows = df[list(RESULT_COLUMNS)].rename(columns=RESULT_COLUMNS)
+    rows["form_number"] = normalize_form_number(rows["form_number"])
+    rows["email"] = normalize_email(rows["email"])
+    rows["mobile"] = normalize_mobile(rows["mobile"])
+    rows.insert(0, "list_name", list_name)
+    rows.insert(0, "run_id", run_id)
+    return rows
+
+
+def save_run(general_df, category_lists, pwd_df, program_name, seat_inputs, multiplier,
+             campus=None, source_file=None, db_path=DB_PATH):
+    """Persist one generated set of merit lists and return its run id."""
+    with connect(db_path) as conn:
+        cur = conn.execute(
+            "INSERT INTO runs (created_at, campus, program_name, source_file, multiplier, seat_inputs) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                datetime.now().isoformat(timespec="seconds"), campus, program_name, source_file,
+                int(multiplier), json.dumps({k: int(v) for k, v in seat_inputs.items()}),
+            ),
+        )
+        run_id = cur.lastrowid
+
+        lists = [_to_rows(general_df, run_id, "GENERAL")]
+        lists += [_to_rows(cat_df, run_id, cat) for cat, cat_df in category_lists.items()]
+        if not pwd_df.empty:
+            lists.append(_to_rows(pwd_df, run_id, "PwD"))
+        pd.concat(lists, ignore_index=True).to_sql("results", conn, if_exists="append", index=False)
+    return run_id
+
+
+def list_runs(program_name=None, db_path=DB_PATH):
+    query = "SELECT * FROM runs"
+    params = ()
+    if program_name:
+        query += " WHERE program_name = ?"
+        params = (program_name,)
+    with connect(db_path) as conn:
+        return pd.read_sql_query(query + " ORDER BY run_id DESC", conn, params=params)
+
+
+def lookup_applicant(query, db_path=DB_PATH):
+    """Find every stored result for a FORM NUMBER, EMAIL or MOBILE across all runs."""
+    query = str(query).strip()
+    if not query:
+        return pd.DataFrame()
+    form_number = normalize_form_number(pd.Series([query])).iloc[0]
+    email = normalize_email(pd.Series([query])).iloc[0]
+    mobile = normalize_mobile(pd.Series([query])).iloc[0]
+
+    # Each branch of the UNION can use its own index
+    sql = """
+        SELECT r.run_id, u.created_at, u.campus, u.program_name, r.list_name, r.merit_no,
+               r.form_number, r.name, r.category, r.email, r.mobile, r.marks, r.status
+        FROM (
+            SELECT rowid FROM results WHERE form_number = ?
+            UNION SELECT rowid FROM results WHERE email = ?
+            UNION SELECT rowid FROM results WHERE mobile = ?
+        ) m
+        JOIN results r ON r.rowid = m.rowid
+        JOIN runs u ON u.run_id = r.run_id
+        ORDER BY r.run_id DESC, r.list_name
+    """
+    with connect(db_path) as conn:
+        return pd.read_sql_query(sql, conn, params=(form_number, email, mobile or None))
+
+
+def run_list_names(run_id, db_path=DB_PATH):
+    """Names of the merit lists (GENERAL, categories, PwD) stored for a run."""
+    with connect(db_path) as conn:
+        rows = conn.execute("SELECT DISTINCT list_name FROM results WHERE run_id = ?", (int(run_id),))
+        return {name for (name,) in rows}
+
+
+def load_run_list(run_id, list_name, db_path=DB_PATH):
+    with connect(db_path) as conn:
+        return pd.read_sql_query(
+            "SELECT * FROM results WHERE run_id = ? AND list_name = ? ORDER BY merit_no",
+            conn, params=(int(run_id), list_name),
+        )
+
+
+def _with_form_number(rows):
+    return rows[rows["form_number"].notna() & rows["form_number"].ne("")]
+
+
+def diff_runs(old_run_id, new_run_id, list_name="GENERAL", db_path=DB_PATH):
+    """Return applicants whose counselling status differs between two runs of a list."""
+    # Rows without a FORM NUMBER can't be matched; pandas would pair every
+    # null key with every other one
+    old = _with_form_number(load_run_list(old_run_id, list_name, db_path))
+    new = _with_form_number(load_run_list(new_run_id, list_name, db_path))
+    merged = old[["form_number", "name", "merit_no", "status"]].merge(
+        new[["form_number", "name", "merit_no", "status"]],
+        on="form_number", how="outer", suffixes=(" (old)", " (new)"), indicator=True,
+    )
+    merged["name"] = merged["name (new)"].fillna(merged["name (old)"])
+    merged["Change"] = (
+        merged["status (old)"].fillna("Not listed") + " → " + merged["status (new)"].fillna("Not listed")
+    )
+    changed = merged[(merged["_merge"] != "both") | (merged["status (old)"] != merged["status (new)"])]
+    return changed[[
+        "form_number", "name", "merit_no (old)", "status (old)", "merit_no (new)", "status (new)", "Change"
+    ]].sort_values("merit_no (new)", na_position="last").reset_index(drop=True)
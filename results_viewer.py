@@ -0,0 +1,105 @@
+import math
+
+import pandas as pd
+import streamlit as st
+
+from data_validation import summarize_report
+
+DEFAULT_PAGE_SIZE = 50
+PAGE_SIZE_OPTIONS = [25, 50, 100, 250]
+SEARCH_COLUMNS = ["FORM NUMBER", "NAME OF THE APPLICANT"]
+TIE_COLUMN = "_tie"
+
+
+def prepare_results(df, columns=None):
+    """Select the display columns and mark ties once per generated list.
+
+    Store the returned frame and pass it to show_paginated_results, so page
+    views only slice it instead of rescanning the whole list.
+    """
+    view = df[columns] if columns else df.copy()
+    if "ObtainMarks" in view.columns:
+        # Computed on the full list so ties that span a page boundary are still outlined
+        view[TIE_COLUMN] = view["ObtainMarks"].duplicated(keep=False)
+    return view
+
+
+def search_results(df, query):
+    """Return the rows whose FORM NUMBER or applicant name contains `query`."""
+    query = (query or "").strip()
+    if not query:
+        return df
+    mask = pd.Series(False, index=df.index)
+    for col in SEARCH_COLUMNS:
+        if col in df.columns:
+            mask |= df[col].astype(str).str.contains(query, case=False, regex=False, na=False)
+    return df[mask]
+
+
+def paginate(df, page, page_size):
+    """Slice out a single page (1-based) of `df`."""
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
+
+
+def page_styles(page_df, tie_mask, category_colors):
+    """Build the CSS for one page in a single pass over its columns."""
+    base = (
+        page_df["CATEGORY"].astype(str).str.strip().str.upper()
+        .map(category_colors).fillna("#FFFFFF")
+    )
+    css = "background-color: " + base + ";"
+    css = css.where(~tie_mask, css + "border: 2px solid red;")
+    return pd.DataFrame({col: css for col in page_df.columns}, index=page_df.index)
+
+
+@st.fragment
+def show_paginated_results(view, key, category_colors=None, page_size=DEFAULT_PAGE_SIZE):
+    """Render a frame from prepare_results one page at a time with server-side search.
+
+    Only the visible page is sent to the browser, and as a fragment paging
+    or searching reruns just this viewer, not the whole app.
+    """
+    search_col, size_col = st.columns([3, 1])
+    query = search_col.text_input("🔎 Search by FORM NUMBER or Name", key=f"{key}_search")
+    page_size = size_col.selectbox(
+        "Rows per page", PAGE_SIZE_OPTIONS,
+        index=PAGE_SIZE_OPTIONS.index(page_size) if page_size in PAGE_SIZE_OPTIONS else 1,
+        key=f"{key}_page_size",
+    )
+
+    filtered = search_results(view, query)
+    total_pages = max(1, math.ceil(len(filtered) / page_size))
+    page_key = f"{key}_page"
+    # A new search or page size can shrink the page count below the current page
+    if st.session_state.get(page_key, 1) > total_pages:
+        st.session_state[page_key] = total_pages
+    page = st.number_input(
+        f"Page (1–{total_pages})", min_value=1, max_value=total_pages, step=1, key=page_key
+    )
+    page_df = paginate(filtered, page, page_size)
+    tie_mask = page_df[TIE_COLUMN] if TIE_COLUMN in page_df.columns else None
+    page_df = page_df.drop(columns=TIE_COLUMN, errors="ignore")
+
+    if category_colors and "CATEGORY" in page_df.columns and tie_mask is not None:
+        styles = page_styles(page_df, tie_mask, category_colors)
+        st.dataframe(page_df.style.apply(lambda _: styles, axis=None), use_container_width=True)
+    else:
+        st.dataframe(page_df, use_container_width=True)
+
+    st.caption(f"Showing {len(page_df)} of {len(filtered)} matching rows ({len(view)} total)")
+
+
+def show_validation_report(report, file_label):
+    """Show rows flagged by validation, with a per-reason summary and CSV export."""
+    excluded = int(report["Excluded from Ranking"].sum())
+    with st.expander(f"🚫 Flagged Rows ({len(report)}, {excluded} excluded from ranking)", expanded=False):
+        if report.empty:
+            st.success("All rows passed validation.")
+            return
+        st.dataframe(summarize_report(report), use_container_width=True)
+        show_paginated_results(prepare_results(report), key=f"rejected_{file_label}")
+        st.download_button(
+            "⬇️ Download Validation Report", data=report.to_csv(index=False).encode("utf-8"),
+            file_name=f"{file_label}_validation_report.csv", mime="text/csv", key=f"download_rejected_{file_label}",
+        )
@@ -0,0 +1,77 @@
+import pandas as pd
+
+from data_validation import validate_applicants
+
+
+def make_df(**overrides):
+    row = {
+        "FORM NUMBER": "F1",
+        "NAME OF THE APPLICANT": "Applicant",
+        "EMAIL": "applicant@example.com",
+        "MOBILE": "9876543210",
+        "PwD (PERCENTAGE OF DISABILITY)": None,
+        "Final_Attendance": "Present",
+        "ObtainMarks": 40,
+    }
+    row.update(overrides)
+    return pd.DataFrame([row])
+
+
+def test_valid_row_passes():
+    valid, report = validate_applicants(make_df())
+    assert len(valid) == 1
+    assert report.empty
+
+
+def test_formatted_and_international_mobiles_are_valid():
+    for mobile in ["94308 91802", "+91 63595 97891", "92271-48880", "971566135049", 9876543210.0, "9876543210.0"]:
+        valid, report = validate_applicants(make_df(MOBILE=mobile))
+        assert len(valid) == 1, mobile
+        assert report.empty, mobile
+
+
+def test_blank_contact_fields_are_not_flagged():
+    valid, report = validate_applicants(make_df(MOBILE=None, EMAIL="  "))
+    assert len(valid) == 1
+    assert report.empty
+
+
+def test_malformed_contact_fields_are_reported_but_ranked():
+    valid, report = validate_applicants(make_df(MOBILE="12345", EMAIL="not-an-email"))
+    assert len(valid) == 1
+    assert len(report) == 1
+    assert not report["Excluded from Ranking"].iloc[0]
+    assert report["Reasons"].iloc[0] == "Malformed mobile number; Malformed email"
+
+
+def test_bad_pwd_is_reported_but_ranked_without_pwd():
+    for pwd in [-5, 140, "140", "40%", "NA", "abc"]:
+        valid, report = validate_applicants(make_df(**{"PwD (PERCENTAGE OF DISABILITY)": pwd}))
+        # Present with valid marks, so still in the general/category lists
+        assert len(valid) == 1, pwd
+        assert pd.isna(valid["PwD (PERCENTAGE OF DISABILITY)"].iloc[0]), pwd
+        assert not report["Excluded from Ranking"].iloc[0]
+        assert report["Reasons"].iloc[0] == "PwD % outside 0-100"
+
+
+def test_pwd_in_range_passes():
+    for pwd in [0, 40, 100, "75"]:
+        valid, report = validate_applicants(make_df(**{"PwD (PERCENTAGE OF DISABILITY)": pwd}))
+        assert len(valid) == 1, pwd
+        assert valid["PwD (PERCENTAGE OF DISABILITY)"].iloc[0] == pwd
+        assert report.empty, pwd
+
+
+def test_absent_and_invalid_marks_are_excluded():
+    df = pd.concat([make_df(Final_Attendance="Absent"), make_df(ObtainMarks="AB"), make_df()], ignore_index=True)
+    valid, report = validate_applicants(df)
+    assert list(valid.index) == [2]
+    assert list(report["Source Row"]) == [2, 3]
+    assert list(report["Reasons"]) == ["Not marked present", "Invalid or missing marks"]
+
+
+def test_missing_rule_column_is_skipped():
+    df = make_df().drop(columns=["Final_Attendance", "MOBILE"])
+    valid, report = validate_applicants(df)
+    assert len(valid) == 1
+    assert report.empty
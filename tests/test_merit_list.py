@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from merit_list import MERIT_COLUMNS, generate_merit_list
+
+
+def reference_merit_list(df, seat_matrix):
+    # The original per-category loop from app_test.py. Concat happens once
+    # here so dtypes don't depend on concatenating onto an empty frame.
+    tops = []
+    for category in df["CATEGORY"].dropna().unique():
+        cat_df = df[df["CATEGORY"] == category]
+        seats = int(seat_matrix.get(category, 0)) * 2
+        top = cat_df.sort_values(by="ObtainMarks", ascending=False, kind="stable").head(seats).copy()
+        top.insert(0, "Sl. No.", range(1, len(top) + 1))
+        tops.append(top)
+    return pd.concat(tops)[MERIT_COLUMNS]
+
+
+@pytest.fixture
+def applicants():
+    categories = ["OBC-NCL", "GENERAL", "EWS", "GENERAL", "OBC-NCL", None, "GENERAL", "EWS", "GENERAL", "OBC-NCL",
+                  "GENERAL", "SC"]
+    marks = [55, 70, 40, 88, 61, 99, 45, 52, 70, 30, 20, 65]
+    return pd.DataFrame({
+        "FORM NUMBER": [f"F{i}" for i in range(len(marks))],
+        "Applicant Registration No": [f"R{i}" for i in range(len(marks))],
+        "NAME OF THE APPLICANT": [f"Applicant {i}" for i in range(len(marks))],
+        "CATEGORY": categories,
+        "ObtainMarks": marks,
+    })
+
+
+def test_matches_per_category_loop(applicants):
+    seats = {"GENERAL": 2, "OBC-NCL": 1, "EWS": 5, "SC": 0}
+    pd.testing.assert_frame_equal(generate_merit_list(applicants, seats), reference_merit_list(applicants, seats))
+
+
+def test_category_order_cutoff_and_numbering(applicants):
+    result = generate_merit_list(applicants, {"GENERAL": 2, "OBC-NCL": 1, "EWS": 5, "SC": 0})
+
+    # Categories in order of first appearance; seats × 2 per category
+    assert list(result["CATEGORY"]) == ["OBC-NCL", "OBC-NCL", "GENERAL", "GENERAL", "GENERAL", "GENERAL", "EWS", "EWS"]
+    assert list(result["Sl. No."]) == [1, 2, 1, 2, 3, 4, 1, 2]
+    assert list(result["ObtainMarks"]) == [61, 55, 88, 70, 70, 45, 52, 40]
+
+
+def test_zero_and_missing_seat_categories_are_dropped(applicants):
+    result = generate_merit_list(applicants, {"GENERAL": 1, "SC": 0})
+    assert set(result["CATEGORY"]) == {"GENERAL"}
+    assert list(result["FORM NUMBER"]) == ["F3", "F1"]
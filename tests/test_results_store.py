@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from results_store import diff_runs, list_runs, lookup_applicant, run_list_names, save_run
+
+
+def merit_rows(rows):
+    return pd.DataFrame(rows, columns=[
+        "Merit No.", "FORM NUMBER", "NAME OF THE APPLICANT", "CATEGORY", "EMAIL", "MOBILE",
+        "ObtainMarks", "Counselling Status",
+    ])
+
+
+EMPTY = merit_rows([])
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "results.sqlite")
+
+
+def save(db_path, general, categories=None, pwd=EMPTY, program_name="M.SC. CYBER SECURITY", campus="Goa"):
+    return save_run(
+        general, categories or {}, pwd, program_name, {"GENERAL": 2, "SC": 1}, multiplier=3,
+        campus=campus, source_file="merged.xlsx", db_path=db_path,
+    )
+
+
+def test_save_run_records_inputs_and_lists(db_path):
+    general = merit_rows([[1, "F1", "Asha", "GENERAL", "a@x.com", "9876543210", 80, "Called for Counselling"]])
+    sc = merit_rows([[1, "F2", "Ravi", "SC", "r@x.com", "9123456780", 60, "Called for Counselling"]])
+    pwd = merit_rows([[1, "F2", "Ravi", "SC", "r@x.com", "9123456780", 60, "--"]])
+
+    run_id = save(db_path, general, {"SC": sc}, pwd)
+
+    runs = list_runs(db_path=db_path)
+    assert list(runs["run_id"]) == [run_id]
+    assert runs["campus"].iloc[0] == "Goa"
+    assert runs["multiplier"].iloc[0] == 3
+    assert runs["seat_inputs"].iloc[0] == '{"GENERAL": 2, "SC": 1}'
+    assert run_list_names(run_id, db_path=db_path) == {"GENERAL", "SC", "PwD"}
+
+
+def test_lookup_normalizes_mobile_email_and_form_number(db_path):
+    general = merit_rows([
+        [1, 1001.0, "Asha", "GENERAL", " Asha@Example.COM ", "+91 98765 43210", 80, "Called for Counselling"],
+        [2, "F2", "Ravi", "GENERAL", "ravi@x.com", 9123456780.0, 70, "Waitlisted"],
+    ])
+    save(db_path, general)
+
+    for query in ["1001", "asha@example.com", "ASHA@example.com", "9876543210", "+919876543210", "09876543210"]:
+        result = lookup_applicant(query, db_path=db_path)
+        assert list(result["name"]) == ["Asha"], query
+
+    result = lookup_applicant("9123456780", db_path=db_path)
+    assert list(result["name"]) == ["Ravi"]
+    assert result["mobile"].iloc[0] == "9123456780"
+
+
+def test_lookup_unions_matches_across_runs_without_duplicates(db_path):
+    general = merit_rows([[1, "F1", "Asha", "GENERAL", "f1@x.com", "9876543210", 80, "Called for Counselling"]])
+    first = save(db_path, general, campus="Goa")
+    second = save(db_path, general, campus="Delhi")
+
+    # "F1" only matches the form number; each stored row is returned once per run
+    result = lookup_applicant("F1", db_path=db_path)
+    assert list(result["run_id"]) == [second, first]
+    assert list(result["campus"]) == ["Delhi", "Goa"]
+
+    assert lookup_applicant("  ", db_path=db_path).empty
+    assert lookup_applicant("nobody@x.com", db_path=db_path).empty
+
+
+def test_diff_runs_reports_status_changes(db_path):
+    old = save(db_path, merit_rows([
+        [1, "A", "Asha", "GENERAL", None, None, 90, "Called for Counselling"],
+        [2, "B", "Ravi", "GENERAL", None, None, 80, "Waitlisted"],
+        [3, "C", "Meena", "GENERAL", None, None, 70, "Called for Counselling"],
+    ]))
+    new = save(db_path, merit_rows([
+        [1, "A", "Asha", "GENERAL", None, None, 90, "Called for Counselling"],
+        [2, "B", "Ravi", "GENERAL", None, None, 80, "Called for Counselling"],
+        [3, "D", "John", "GENERAL", None, None, 60, "Waitlisted"],
+    ]))
+
+    changes = diff_runs(old, new, "GENERAL", db_path=db_path).set_index("form_number")
+
+    assert set(changes.index) == {"B", "C", "D"}
+    assert changes.loc["B", "Change"] == "Waitlisted → Called for Counselling"
+    assert changes.loc["C", "Change"] == "Called for Counselling → Not listed"
+    assert changes.loc["D", "Change"] == "Not listed → Waitlisted"
+    assert changes.loc["D", "name"] == "John"
+
+
+def test_diff_runs_ignores_missing_form_numbers(db_path):
+    rows = [
+        [1, "A", "Asha", "GENERAL", None, None, 90, "Called for Counselling"],
+        [2, np.nan, "No Form 1", "GENERAL", None, None, 80, "Waitlisted"],
+        [3, "", "No Form 2", "GENERAL", None, None, 70, "Waitlisted"],
+    ]
+    old = save(db_path, merit_rows(rows))
+    rows[0][-1] = "Waitlisted"
+    new = save(db_path, merit_rows(rows))
+
+    changes = diff_runs(old, new, "GENERAL", db_path=db_path)
+
+    # Only the real applicant, no cross product of the null keys
+    assert list(changes["form_number"]) == ["A"]
+    assert changes["Change"].iloc[0] == "Called for Counselling → Waitlisted"